@@ -28,7 +28,7 @@ function create_completer(commands)
     if current[last_word] and current[last_word].options and words[#words]:sub(1, 1) == '-' then
       local matches = {}
       for opt, _ in pairs(current[last_word].options) do
-        if opt:find('^' .. vim.pesc(words[#words])) then
+        if vim.startswith(opt, words[#words]) then
           table.insert(matches, opt)
         end
       end
@@ -43,7 +43,7 @@ function create_completer(commands)
     -- Complete available commands at this level
     local matches = {}
     for cmd in pairs(current) do
-      if cmd:find('^' .. vim.pesc(arglead)) then
+      if vim.startswith(cmd, arglead) then
         table.insert(matches, cmd)
       end
     end
@@ -264,7 +264,7 @@ function M.setup()
         local names = {}
 
         for _, provider_data in ipairs(providers) do
-          if provider_data.name:find('^' .. arglead) then
+          if vim.startswith(provider_data.name, arglead) then
             table.insert(names, provider_data.name)
           end
         end
@@ -310,7 +310,7 @@ function M.setup()
             local options = { 'toggle', 'enable', 'disable' }
             local matches = {}
             for _, opt in ipairs(options) do
-              if opt:find('^' .. vim.pesc(arglead)) then
+              if vim.startswith(opt, arglead) then
                 table.insert(matches, opt)
               end
             end
@@ -341,7 +341,7 @@ function M.setup()
             local options = { 'toggle', 'enable', 'disable' }
             local matches = {}
             for _, opt in ipairs(options) do
-              if opt:find('^' .. vim.pesc(arglead)) then
+              if vim.startswith(opt, arglead) then
                 table.insert(matches, opt)
               end
             end
@@ -375,7 +375,7 @@ function M.setup()
             local levels = { 'TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR' }
             local matches = {}
             for _, level in ipairs(levels) do
-              if level:find('^' .. vim.pesc(arglead:upper())) then
+              if vim.startswith(level, arglead:upper()) then
                 table.insert(matches, level)
               end
             end
@@ -414,7 +414,7 @@ function M.setup()
 
             local filtered = {}
             for _, m in ipairs(matches) do
-              if m:find('^' .. vim.pesc(arglead)) then
+              if vim.startswith(m, arglead) then
                 table.insert(filtered, m)
               end
             end
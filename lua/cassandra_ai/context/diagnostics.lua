@@ -40,17 +40,18 @@ function DiagnosticsContextProvider:get_name()
   return 'diagnostics'
 end
 
+-- Severity labels, built once rather than per formatted diagnostic
+local severity_map = {
+  [vim.diagnostic.severity.ERROR] = 'ERROR',
+  [vim.diagnostic.severity.WARN] = 'WARN',
+  [vim.diagnostic.severity.INFO] = 'INFO',
+  [vim.diagnostic.severity.HINT] = 'HINT',
+}
+
 --- Format diagnostic message
 --- @param diagnostic table Diagnostic object
 --- @return string Formatted diagnostic
 local function format_diagnostic(diagnostic)
-  local severity_map = {
-    [vim.diagnostic.severity.ERROR] = 'ERROR',
-    [vim.diagnostic.severity.WARN] = 'WARN',
-    [vim.diagnostic.severity.INFO] = 'INFO',
-    [vim.diagnostic.severity.HINT] = 'HINT',
-  }
-
   local severity = severity_map[diagnostic.severity] or 'INFO'
   local line = diagnostic.lnum + 1 -- Convert to 1-indexed
   return string.format('[%s] Line %d: %s', severity, line, diagnostic.message)
@@ -69,17 +70,17 @@ local function get_diagnostics(bufnr, cursor_line, opts)
   local range_start = math.max(0, cursor_line - opts.diagnostic_range)
   local range_end = cursor_line + opts.diagnostic_range
 
-  local diagnostics = vim.diagnostic.get(bufnr, {
-    lnum = cursor_line,
-  })
-
-  -- Also get diagnostics in the range
-  local all_diagnostics = vim.diagnostic.get(bufnr)
-  for _, diag in ipairs(all_diagnostics) do
-    if diag.lnum >= range_start and diag.lnum <= range_end and diag.lnum ~= cursor_line then
+  -- Single pass over the buffer's diagnostics: cursor line first, then the surrounding range
+  local diagnostics = {}
+  local nearby = {}
+  for _, diag in ipairs(vim.diagnostic.get(bufnr)) do
+    if diag.lnum == cursor_line then
       table.insert(diagnostics, diag)
+    elseif diag.lnum >= range_start and diag.lnum <= range_end then
+      table.insert(nearby, diag)
     end
   end
+  vim.list_extend(diagnostics, nearby)
 
   -- Sort by severity and limit
   table.sort(diagnostics, function(a, b)
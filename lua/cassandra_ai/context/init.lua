@@ -1,6 +1,5 @@
 --- Context Provider Manager
 --- Orchestrates multiple context providers and merges their results
-local async = require('plenary.async')
 local logger = require('cassandra_ai.logger')
 
 local M = {}
@@ -92,6 +91,11 @@ function M.register_provider(provider_config)
   end
 end
 
+--- Order contexts by ascending priority (default 10)
+local function by_priority(a, b)
+  return (a.priority or 10) < (b.priority or 10)
+end
+
 --- Merge multiple context results using configured strategy
 --- @param contexts table[] Array of context results
 --- @return string Merged context
@@ -102,28 +106,21 @@ local function merge_contexts(contexts)
 
   if config.merge_strategy == 'custom' and config.custom_merger then
     return config.custom_merger(contexts)
-  elseif config.merge_strategy == 'weighted' then
-    -- Sort by priority and concatenate
-    table.sort(contexts, function(a, b)
-      return (a.priority or 10) < (b.priority or 10)
-    end)
-    local parts = {}
-    for _, ctx in ipairs(contexts) do
-      if ctx.content and ctx.content ~= '' then
-        table.insert(parts, ctx.content)
-      end
-    end
-    return table.concat(parts, '\n\n')
-  else
-    -- Default: simple concatenation
-    local parts = {}
-    for _, ctx in ipairs(contexts) do
-      if ctx.content and ctx.content ~= '' then
-        table.insert(parts, ctx.content)
-      end
+  end
+
+  if config.merge_strategy == 'weighted' then
+    -- Sort by priority before concatenating
+    table.sort(contexts, by_priority)
+  end
+
+  -- Concatenate non-empty contexts (in priority order for "weighted")
+  local parts = {}
+  for _, ctx in ipairs(contexts) do
+    if ctx.content and ctx.content ~= '' then
+      table.insert(parts, ctx.content)
     end
-    return table.concat(parts, '\n\n')
   end
+  return table.concat(parts, '\n\n')
 end
 
 --- @class ContextParameterParams
@@ -3,6 +3,9 @@
 
 local M = {}
 
+-- Access modifiers that may precede a `function` keyword without trailing whitespace
+local access_modifiers = { public = true, protected = true, private = true }
+
 --- Extract imports/use statements for this language
 --- @param bufnr number Buffer number
 --- @param lines table Buffer lines
@@ -42,7 +45,10 @@ function M.extract_class_context(bufnr, lines, start_line, end_line, include_pri
     end
     local line = lines[i]
 
-    if line:match('^%s*//%s') or line:match('^%s*/%*') or line:match('^%s*%*') or line:match('^%s*#') then
+    -- One anchored match for the comment leader; only '/' needs a second look (// or /*)
+    local comment_lead = line:match('^%s*([/%*#])')
+
+    if comment_lead and (comment_lead ~= '/' or line:match('^%s*//%s') or line:match('^%s*/%*')) then
       table.insert(context_lines, line)
     elseif line:match('class%s+') or line:match('interface%s+') or line:match('trait%s+') then
       table.insert(context_lines, line)
@@ -56,7 +62,11 @@ function M.extract_class_context(bufnr, lines, start_line, end_line, include_pri
   for i = start_line + 1, math.min(end_line + 1, #lines) do
     local line = lines[i]
 
-    if line:match('function%s+') or line:match('def%s+') or line:match('public%s+function') or line:match('protected%s+function') or line:match('private%s+function') then
+    -- Cheap plain-substring prefilter; most lines contain neither keyword
+    local candidate = line:find('function', 1, true) or line:find('def', 1, true)
+
+    -- A single capture of the word before `function` replaces one scan per access modifier
+    if candidate and (line:match('function%s+') or line:match('def%s+') or access_modifiers[line:match('(%a+)%s+function')]) then
       if include_private or not M.is_private(line) then
         local sig_start = math.max(start_line, i - 6)
         local signature = M.extract_signature(lines, sig_start, i - 1)
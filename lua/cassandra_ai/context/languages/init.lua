@@ -6,6 +6,9 @@ local M = {}
 --- Cache for loaded language handlers
 local handlers = {}
 
+--- Cache of whether an unmapped filetype has a handler module of the same name
+local handler_available = {}
+
 --- Map filetypes to language handlers
 local filetype_map = {
   python = 'python',
@@ -60,7 +63,16 @@ end
 --- @param filetype string The filetype
 --- @return boolean
 function M.has_handler(filetype)
-  return filetype_map[filetype] ~= nil or pcall(require, 'cassandra_ai.context.languages.' .. filetype)
+  if filetype_map[filetype] ~= nil then
+    return true
+  end
+  -- A failed require searches the whole runtimepath, so only try it once per filetype. Unlike optional
+  -- third-party plugins, handlers are bundled modules in this plugin's own namespace, so a miss is final;
+  -- get_handler() likewise caches its base fallback for the session
+  if handler_available[filetype] == nil then
+    handler_available[filetype] = pcall(require, 'cassandra_ai.context.languages.' .. filetype)
+  end
+  return handler_available[filetype]
 end
 
 --- Get list of supported languages
@@ -35,79 +35,94 @@ local skip_names_common = {
   ['nil'] = true,
 }
 
+-- Shared by all JavaScript/TypeScript filetypes
+local skip_names_js = { ['undefined'] = true, ['this'] = true, ['super'] = true }
+-- Shared by languages whose only receivers are this/super
+local skip_names_this_super = { ['this'] = true, ['super'] = true }
+-- Shared by languages whose only receiver is self
+local skip_names_self = { ['self'] = true }
+
 local skip_names_by_ft = {
-  javascript = { ['undefined'] = true, ['this'] = true, ['super'] = true },
-  typescript = { ['undefined'] = true, ['this'] = true, ['super'] = true },
-  typescriptreact = { ['undefined'] = true, ['this'] = true, ['super'] = true },
-  javascriptreact = { ['undefined'] = true, ['this'] = true, ['super'] = true },
+  javascript = skip_names_js,
+  typescript = skip_names_js,
+  typescriptreact = skip_names_js,
+  javascriptreact = skip_names_js,
   python = { ['self'] = true, ['cls'] = true, ['True'] = true, ['False'] = true, ['None'] = true },
-  java = { ['this'] = true, ['super'] = true },
-  kotlin = { ['this'] = true, ['super'] = true },
+  java = skip_names_this_super,
+  kotlin = skip_names_this_super,
   cs = { ['this'] = true, ['base'] = true },
-  dart = { ['this'] = true, ['super'] = true },
-  ruby = { ['self'] = true },
+  dart = skip_names_this_super,
+  ruby = skip_names_self,
   php = { ['this'] = true, ['self'] = true, ['parent'] = true },
   c = { ['NULL'] = true },
   cpp = { ['this'] = true, ['NULL'] = true, ['nullptr'] = true },
-  lua = { ['self'] = true },
+  lua = skip_names_self,
   swift = { ['self'] = true, ['Self'] = true, ['super'] = true },
   rust = { ['self'] = true, ['Self'] = true },
 }
 
-local function should_skip_name(text, bufnr)
+--- @param text string
+--- @param ft_skips table|nil Filetype-specific skip set, resolved once per scan
+local function should_skip_name(text, ft_skips)
   if skip_names_common[text] then
     return true
   end
-  local ft = vim.bo[bufnr or 0].filetype
-  local ft_skips = skip_names_by_ft[ft]
   return ft_skips ~= nil and ft_skips[text] == true
 end
 
 --- Walk treesitter tree and collect unique identifiers in the given line range (1-indexed)
-local function get_identifiers_in_range(bufnr, start_line, end_line)
-  logger.trace(string.format('context.lsp.get_identifiers_in_range(%s, %s, %s)', bufnr, start_line, end_line))
+local function scan_identifiers_in_range(bufnr, start_line, end_line)
+  logger.trace(string.format('context.lsp.scan_identifiers_in_range(%s, %s, %s)', bufnr, start_line, end_line))
   if not vim.treesitter or not vim.treesitter.get_parser then
-    logger.trace('context.lsp.get_identifiers_in_range() -> no treesitter, returning empty table')
+    logger.trace('context.lsp.scan_identifiers_in_range() -> no treesitter, returning empty table')
     return {}
   end
 
   local ok, parser = pcall(vim.treesitter.get_parser, bufnr)
   if not ok or not parser then
-    logger.trace('context.lsp.get_identifiers_in_range() -> no treesitter parser for bufnr ' .. bufnr)
+    logger.trace('context.lsp.scan_identifiers_in_range() -> no treesitter parser for bufnr ' .. bufnr)
     return {}
   end
 
   local trees = parser:parse()
   if not trees or not trees[1] then
-    logger.trace('context.lsp.get_identifiers_in_range() -> no trees')
+    logger.trace('context.lsp.scan_identifiers_in_range() -> no trees')
     return {}
   end
 
   local identifiers = {}
   local seen = {}
+  local ft_skips = skip_names_by_ft[vim.bo[bufnr].filetype]
+  -- 0-indexed row bounds, computed once rather than per visited node
+  local first_row = start_line - 1
+  local last_row = end_line - 1
 
   local function collect_from_tree(tree)
     local root = tree:root()
 
     local function visit(node)
       local sr, sc, er, _ = node:range()
-      if sr > end_line - 1 then
+      if sr > last_row then
         return
       end
-      if er < start_line - 1 then
+      if er < first_row then
         return
       end
 
       local node_type = node:type()
       if identifier_types[node_type] then
         local text_ok, text = pcall(vim.treesitter.get_node_text, node, bufnr)
-        if text_ok and text and text ~= '' and not should_skip_name(text, bufnr) and not seen[text] then
+        if text_ok and text and text ~= '' and not should_skip_name(text, ft_skips) and not seen[text] then
           seen[text] = true
           table.insert(identifiers, { name = text, line = sr, col = sc })
         end
       end
 
       for child in node:iter_children() do
+        -- Children are ordered by position; every later sibling also starts past the range
+        if child:start() > last_row then
+          break
+        end
         visit(child)
       end
     end
@@ -122,6 +137,35 @@ local function get_identifiers_in_range(bufnr, start_line, end_line)
   return identifiers
 end
 
+--- Result of the last identifier scan; cursor moves without edits rescan the same text
+local identifier_cache = {}
+
+--- Collect identifiers in range, reusing the last scan while the buffer and its filetype are unchanged
+local function get_identifiers_in_range(bufnr, start_line, end_line)
+  if bufnr == 0 then
+    bufnr = vim.api.nvim_get_current_buf()
+  end
+  local changedtick = vim.api.nvim_buf_get_changedtick(bufnr)
+  -- :set ft= does not bump changedtick but changes the parser language and skip names
+  local filetype = vim.bo[bufnr].filetype
+  local c = identifier_cache
+  if c.bufnr == bufnr and c.changedtick == changedtick and c.filetype == filetype and c.start_line == start_line and c.end_line == end_line then
+    logger.trace('context.lsp.get_identifiers_in_range() -> cached')
+    return c.identifiers
+  end
+
+  local identifiers = scan_identifiers_in_range(bufnr, start_line, end_line)
+  identifier_cache = {
+    bufnr = bufnr,
+    changedtick = changedtick,
+    filetype = filetype,
+    start_line = start_line,
+    end_line = end_line,
+    identifiers = identifiers,
+  }
+  return identifiers
+end
+
 -- ---------------------------------------------------------------------------
 -- LSP definition resolution
 -- ---------------------------------------------------------------------------
@@ -182,6 +226,13 @@ local function try_lsp_method(bufnr, method, params, timeout_ms)
   return nil
 end
 
+-- Methods tried in order when resolving where an identifier is defined
+local definition_methods = {
+  'textDocument/definition',
+  'textDocument/typeDefinition',
+  'textDocument/implementation',
+}
+
 local function lsp_get_definition(bufnr, line, col, timeout_ms)
   timeout_ms = timeout_ms or 2000
 
@@ -192,13 +243,7 @@ local function lsp_get_definition(bufnr, line, col, timeout_ms)
 
   local params = make_position_params(bufnr, line, col)
 
-  local methods = {
-    'textDocument/definition',
-    'textDocument/typeDefinition',
-    'textDocument/implementation',
-  }
-
-  for _, method in ipairs(methods) do
+  for _, method in ipairs(definition_methods) do
     local result = try_lsp_method(bufnr, method, params, timeout_ms)
     if result then
       return result
@@ -208,6 +253,50 @@ local function lsp_get_definition(bufnr, line, col, timeout_ms)
   return nil
 end
 
+--- Resolved definitions for the last seen buffer version, keyed by 'line:col'.
+--- Only successful lookups are kept (a nil from buf_request_sync may be a timeout or a busy server),
+--- each with the target file's mtime/size so edits to that file invalidate the stored position.
+local definition_cache = {}
+
+--- Resolve a definition, reusing earlier LSP round trips while the buffer and target file are unchanged
+local function get_definition(bufnr, line, col, timeout_ms)
+  if bufnr == 0 then
+    bufnr = vim.api.nvim_get_current_buf()
+  end
+  local changedtick = vim.api.nvim_buf_get_changedtick(bufnr)
+  if definition_cache.bufnr ~= bufnr or definition_cache.changedtick ~= changedtick then
+    definition_cache = { bufnr = bufnr, changedtick = changedtick, locations = {} }
+  end
+
+  local key = line .. ':' .. col
+  local cached = definition_cache.locations[key]
+  if cached then
+    local stat = vim.uv.fs_stat(cached.filepath)
+    if stat and stat.mtime.sec == cached.mtime_sec and stat.mtime.nsec == cached.mtime_nsec and stat.size == cached.size then
+      logger.trace('context.lsp.get_definition() -> cached ' .. key)
+      return cached.location
+    end
+    definition_cache.locations[key] = nil
+  end
+
+  local location = lsp_get_definition(bufnr, line, col, timeout_ms)
+  local uri = location and (location.uri or location.targetUri)
+  if uri then
+    local filepath = vim.uri_to_fname(uri)
+    local stat = vim.uv.fs_stat(filepath)
+    if stat then
+      definition_cache.locations[key] = {
+        location = location,
+        filepath = filepath,
+        mtime_sec = stat.mtime.sec,
+        mtime_nsec = stat.mtime.nsec,
+        size = stat.size,
+      }
+    end
+  end
+  return location
+end
+
 local function location_to_info(location)
   local uri = location.uri or location.targetUri
   local range = location.range or location.targetSelectionRange or location.targetRange
@@ -290,47 +379,127 @@ local container_types = {
   extension_declaration = true,
 }
 
+--- Files read for definitions, keyed by path and validated against mtime/size.
+--- Each entry holds the file's content and lines and, once parsed, its treesitter tree.
+local file_cache = {}
+local file_cache_order = {} -- Track access order for LRU eviction
+local MAX_FILE_CACHE_SIZE = 50 -- Limit cache to 50 files maximum
+
+--- Mark a cached file as most recently used and evict the least recently used beyond the limit
+local function touch_file_cache(filepath)
+  for i, cached_path in ipairs(file_cache_order) do
+    if cached_path == filepath then
+      table.remove(file_cache_order, i)
+      break
+    end
+  end
+  table.insert(file_cache_order, filepath)
+
+  while #file_cache_order > MAX_FILE_CACHE_SIZE do
+    local lru_path = table.remove(file_cache_order, 1)
+    file_cache[lru_path] = nil
+  end
+end
+
+--- Read a file, reusing the cached entry while its mtime and size are unchanged.
+--- @param filepath string
+--- @return table|nil entry { lines, tree? }
+local function read_file_entry(filepath)
+  local stat = vim.uv.fs_stat(filepath)
+  if not stat then
+    return nil
+  end
+
+  local cached = file_cache[filepath]
+  if cached and cached.mtime_sec == stat.mtime.sec and cached.mtime_nsec == stat.mtime.nsec and cached.size == stat.size then
+    touch_file_cache(filepath)
+    return cached
+  end
+
+  -- One read into a Lua string; readfile() would build a Vimscript list and convert it line by line
+  local file = io.open(filepath, 'rb')
+  if not file then
+    return nil
+  end
+  local content = file:read('*a')
+  file:close()
+  if not content then
+    return nil
+  end
+
+  -- Split like readfile(): drop a UTF-8 BOM, CR before NL and the final newline; an empty file has no lines
+  local lines = {}
+  if content ~= '' then
+    content = content:gsub('^\239\187\191', ''):gsub('\r\n', '\n'):gsub('\n$', '')
+    lines = vim.split(content, '\n', { plain = true })
+  end
+
+  local entry = {
+    mtime_sec = stat.mtime.sec,
+    mtime_nsec = stat.mtime.nsec,
+    size = stat.size,
+    content = content,
+    lines = lines,
+  }
+  file_cache[filepath] = entry
+  touch_file_cache(filepath)
+  return entry
+end
+
+--- Parse a cached file with a treesitter string parser, reusing the tree from earlier calls.
+--- @param entry table Entry from read_file_entry
+--- @param filepath string
+--- @return table|nil tree
+local function get_file_tree(entry, filepath)
+  if entry.tree == nil then
+    entry.tree = false
+
+    local ft = vim.filetype.match({ filename = filepath })
+    if not ft then
+      return nil
+    end
+
+    local parser_ok, parser = pcall(vim.treesitter.get_string_parser, entry.content, ft)
+    if not parser_ok or not parser then
+      return nil
+    end
+
+    local trees = parser:parse()
+    if not trees or not trees[1] then
+      return nil
+    end
+    entry.tree = trees[1]
+  end
+  return entry.tree or nil
+end
+
 --- Read the definition code at filepath:start_line, using treesitter to find the containing declaration.
 --- Falls back to reading max_lines raw lines.
 local function read_definition_code(filepath, start_line, max_lines)
   max_lines = max_lines or 50
 
-  local ok, lines = pcall(vim.fn.readfile, filepath)
-  if not ok or not lines then
+  local entry = read_file_entry(filepath)
+  if not entry then
     return nil, nil
   end
+  local lines = entry.lines
 
   -- Fallback: return raw lines
   local function fallback()
     local end_line = math.min(start_line + max_lines - 1, #lines)
-    local code_lines = {}
-    for i = start_line, end_line do
-      table.insert(code_lines, lines[i])
-    end
-    return table.concat(code_lines, '\n'), end_line
+    return table.concat(lines, '\n', start_line, end_line), end_line
   end
 
   if not vim.treesitter then
     return fallback()
   end
 
-  local ft = vim.filetype.match({ filename = filepath })
-  if not ft then
+  local tree = get_file_tree(entry, filepath)
+  if not tree then
     return fallback()
   end
 
-  local content = table.concat(lines, '\n')
-  local parser_ok, parser = pcall(vim.treesitter.get_string_parser, content, ft)
-  if not parser_ok or not parser then
-    return fallback()
-  end
-
-  local trees = parser:parse()
-  if not trees or not trees[1] then
-    return fallback()
-  end
-
-  local root = trees[1]:root()
+  local root = tree:root()
   local target_row = start_line - 1
   local node = root:named_descendant_for_range(target_row, 0, target_row, 0)
 
@@ -345,11 +514,8 @@ local function read_definition_code(filepath, start_line, max_lines)
       if actual_end - sr > max_lines then
         actual_end = sr + max_lines
       end
-      local code_lines = {}
-      for i = sr + 1, actual_end do
-        table.insert(code_lines, lines[i])
-      end
-      return table.concat(code_lines, '\n'), actual_end
+      actual_end = math.min(actual_end, #lines)
+      return table.concat(lines, '\n', sr + 1, actual_end), actual_end
     end
     node = node:parent()
   end
@@ -437,7 +603,7 @@ function LspContextProvider:get_context(params, callback)
       break
     end
 
-    local location = lsp_get_definition(bufnr, ident.line, ident.col, self.opts.timeout_ms)
+    local location = get_definition(bufnr, ident.line, ident.col, self.opts.timeout_ms)
     if location then
       local info = location_to_info(location)
       if info then
@@ -554,4 +720,8 @@ function LspContextProvider.debug_identifiers(bufnr, start_line, end_line)
   end
 end
 
+-- Expose for testing
+LspContextProvider._get_definition = get_definition
+LspContextProvider._read_file_entry = read_file_entry
+
 return LspContextProvider
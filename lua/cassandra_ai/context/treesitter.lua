@@ -19,6 +19,14 @@ function TreesitterContextProvider:new(opts)
     node_types = nil, -- nil means all types
     context_lines = 5,
   })
+  -- Membership set for the node_types filter, built once instead of scanning the list per node
+  -- Kept on the instance, not in opts, so the user-facing options stay as configured
+  if o.opts.node_types then
+    o._node_type_set = {}
+    for _, node_type in ipairs(o.opts.node_types) do
+      o._node_type_set[node_type] = true
+    end
+  end
   setmetatable(o, self)
   self.__index = self
   return o
@@ -46,31 +54,22 @@ local function get_node_text(node, bufnr)
     return ''
   end
 
-  local start_row, start_col, end_row, end_col = node:range()
-  local lines = vim.api.nvim_buf_get_lines(bufnr, start_row, end_row + 1, false)
-
-  if #lines == 0 then
+  -- Fetches only the node's byte range (nvim_buf_get_text) instead of whole lines that are then re-sliced
+  local ok, text = pcall(vim.treesitter.get_node_text, node, bufnr)
+  if not ok or not text then
     return ''
   end
 
-  -- Handle single line
-  if #lines == 1 then
-    return string.sub(lines[1], start_col + 1, end_col)
-  end
-
-  -- Handle multiple lines
-  lines[1] = string.sub(lines[1], start_col + 1)
-  lines[#lines] = string.sub(lines[#lines], 1, end_col)
-
-  return table.concat(lines, '\n')
+  return text
 end
 
 --- Extract context from parent nodes
 --- @param node table Current treesitter node
 --- @param bufnr number Buffer number
 --- @param opts table Provider options
+--- @param node_type_set table|nil Set of node types to include (nil means all)
 --- @return string Parent context
-local function extract_parent_context(node, bufnr, opts)
+local function extract_parent_context(node, bufnr, opts, node_type_set)
   local context_parts = {}
   local current = node:parent()
   local total_size = 0
@@ -79,7 +78,7 @@ local function extract_parent_context(node, bufnr, opts)
     local node_type = current:type()
 
     -- Filter by node types if specified
-    if not opts.node_types or vim.tbl_contains(opts.node_types, node_type) then
+    if not node_type_set or node_type_set[node_type] then
       local text = get_node_text(current, bufnr)
       local text_size = #text
 
@@ -109,8 +108,9 @@ end
 --- @param bufnr number Buffer number
 --- @param cursor_pos table Cursor position {line, col}
 --- @param opts table Provider options
+--- @param node_type_set table|nil Set of node types to include (nil means all)
 --- @return string Context information
-local function extract_node_context(node, bufnr, cursor_pos, opts)
+local function extract_node_context(node, bufnr, cursor_pos, opts, node_type_set)
   if not node then
     return ''
   end
@@ -119,12 +119,11 @@ local function extract_node_context(node, bufnr, cursor_pos, opts)
   local node_type = node:type()
 
   -- Get the current node info
-  local node_text = get_node_text(node, bufnr)
   table.insert(context_parts, string.format('-- Current node: %s', node_type))
 
   -- Include parent context if enabled
   if opts.include_parent_nodes then
-    local parent_context = extract_parent_context(node, bufnr, opts)
+    local parent_context = extract_parent_context(node, bufnr, opts, node_type_set)
     if parent_context and parent_context ~= '' then
       table.insert(context_parts, '-- Parent context:')
       table.insert(context_parts, parent_context)
@@ -170,14 +169,14 @@ function TreesitterContextProvider:get_context_sync(params)
   end
 
   -- Extract context
-  local context = extract_node_context(node, bufnr, cursor_pos, self.opts)
+  local context = extract_node_context(node, bufnr, cursor_pos, self.opts, self._node_type_set)
 
   return {
     content = context,
     metadata = {
       source = 'treesitter',
       node_type = node:type(),
-      has_parent_context = context:match('-- Parent context:') ~= nil,
+      has_parent_context = context:find('-- Parent context:', 1, true) ~= nil,
     },
   }
 end
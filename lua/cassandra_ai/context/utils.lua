@@ -2,12 +2,12 @@ local M = {}
 
 -- Helper function to check if file has any non-comment code
 local function has_code(bufnr)
-  local lines = vim.api.nvim_buf_get_lines(bufnr, 0, -1, false)
   local parser = vim.treesitter.get_parser(bufnr)
   if not parser then
     -- Fallback: check for non-empty, non-whitespace lines
+    local lines = vim.api.nvim_buf_get_lines(bufnr, 0, -1, false)
     for _, line in ipairs(lines) do
-      if line:match('^%s*$') == nil then
+      if line:find('%S') then
         return true
       end
     end
@@ -122,6 +122,9 @@ local function evict_lru_if_needed()
   end
 end
 
+-- Generic names (lowercased) that indicate anonymous functions
+local anonymous_names = { ['function'] = true, lambda = true, anonymous = true }
+
 -- Recursively extract function/method symbols from LSP response
 -- Helper function to identify legitimately named functions (not anonymous)
 local function is_named_function(symbol)
@@ -141,13 +144,10 @@ local function is_named_function(symbol)
   end
 
   -- Skip generic names that indicate anonymous functions
-  local lower_name = symbol.name:lower()
   if
-    lower_name == 'function'
-    or lower_name == 'lambda'
-    or lower_name == 'anonymous'
-    or symbol.name:match('^function%(') -- Lua-style "function(" pattern
-    or symbol.name:match('^vim%.') -- Skip Neovim API wrappers
+    anonymous_names[symbol.name:lower()]
+    or vim.startswith(symbol.name, 'function(') -- Lua-style "function(" pattern
+    or vim.startswith(symbol.name, 'vim.') -- Skip Neovim API wrappers
     or symbol.name:match('^%[%d+%]$')
   then -- LSP array-style anonymous functions "[1]", "[2]", required for lua_ls
     return false
@@ -161,6 +161,15 @@ function M.get_lsp_clients(bufnr)
   return vim.lsp.get_clients({ bufnr = bufnr })
 end
 
+-- Only check the methods we actually use in this plugin
+-- Note: lens_explorer.lua only handles core capabilities for function discovery.
+-- Additional LSP capabilities (textDocument/definition, textDocument/implementation)
+-- are handled in utils.lua for provider-specific features like the usages provider.
+local capability_map = {
+  ['textDocument/references'] = 'referencesProvider',
+  ['textDocument/documentSymbol'] = 'documentSymbolProvider',
+}
+
 -- Check if any LSP client supports a specific method for the buffer
 function M.has_lsp_capability(bufnr, method)
   local clients = M.get_lsp_clients(bufnr)
@@ -171,15 +180,6 @@ function M.has_lsp_capability(bufnr, method)
   for _, client in ipairs(clients) do
     -- Check if client supports the method
     if client.server_capabilities then
-      -- Only check the methods we actually use in this plugin
-      -- Note: lens_explorer.lua only handles core capabilities for function discovery.
-      -- Additional LSP capabilities (textDocument/definition, textDocument/implementation)
-      -- are handled in utils.lua for provider-specific features like the usages provider.
-      local capability_map = {
-        ['textDocument/references'] = 'referencesProvider',
-        ['textDocument/documentSymbol'] = 'documentSymbolProvider',
-      }
-
       local capability_key = capability_map[method]
       if capability_key and client.server_capabilities[capability_key] then
         return true
@@ -190,15 +190,15 @@ function M.has_lsp_capability(bufnr, method)
   return false
 end
 
+-- Symbol kinds we care about (function / method / constructor), built once rather than per visited symbol
+local symbol_kinds = {
+  [vim.lsp.protocol.SymbolKind.Function] = true,
+  [vim.lsp.protocol.SymbolKind.Method] = true,
+  [vim.lsp.protocol.SymbolKind.Constructor] = true,
+}
+
 function M.extract_symbols_recursive(symbols, functions, start_line, end_line)
   for _, symbol in ipairs(symbols) do
-    -- Identify symbol kinds we care about (function / method / constructor)
-    local symbol_kinds = {
-      [vim.lsp.protocol.SymbolKind.Function] = true,
-      [vim.lsp.protocol.SymbolKind.Method] = true,
-      [vim.lsp.protocol.SymbolKind.Constructor] = true,
-    }
-
     if symbol_kinds[symbol.kind] then
       local include = true
       -- Only add plain Functions if they are "named" per our heuristic
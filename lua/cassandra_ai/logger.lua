@@ -15,6 +15,8 @@ local state = {
   initialized = false,
   log_file = nil,
   log_level = LEVELS.WARN,
+  -- Log file whose directory has already been created/checked
+  ensured_log_file = nil,
 }
 
 --- Initialize the logger
@@ -33,16 +35,21 @@ function M.init(opts)
   state.initialized = true
 end
 
---- Ensure the log directory exists and return the file path
+--- Ensure the log directory exists and return the file path.
+--- The directory is only checked once per log file rather than on every write.
 --- @return string|nil
 local function ensure_log_file()
   if not state.log_file then
     return nil
   end
+  if state.ensured_log_file == state.log_file then
+    return state.log_file
+  end
   local dir = vim.fn.fnamemodify(state.log_file, ':h')
   if vim.fn.isdirectory(dir) == 0 then
     vim.fn.mkdir(dir, 'p')
   end
+  state.ensured_log_file = state.log_file
   return state.log_file
 end
 
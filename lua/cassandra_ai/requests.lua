@@ -11,7 +11,7 @@ function Service:new(o)
 end
 
 function Service:json_decode(data)
-  local status, result = pcall(vim.fn.json_decode, data)
+  local status, result = pcall(vim.json.decode, data)
   if status then
     return result
   else
@@ -40,7 +40,7 @@ function Service:_Request(url, headers, data, cb, args)
       vim.notify('Cannot open temporary message file: ' .. tmpfname, vim.log.levels.ERROR)
       return
     end
-    f:write(vim.fn.json_encode(data))
+    f:write(vim.json.encode(data))
     f:close()
     args[#args + 1] = '-d'
     args[#args + 1] = '@' .. tmpfname
@@ -174,7 +174,8 @@ function M.accept()
     return false
   end
 
-  local num_lines = #vim.split(text, '\n', { plain = true })
+  local comp_lines = vim.split(text, '\n', { plain = true })
+  local num_lines = #comp_lines
   logger.info('completion accepted (' .. num_lines .. ' lines)')
 
   if state.current_request_id then
@@ -190,8 +191,6 @@ function M.accept()
   local before = cur_line:sub(1, col)
   local after_cursor = cur_line:sub(col + 1)
 
-  local comp_lines = vim.split(text, '\n', { plain = true })
-
   state.internal_move = true
 
   local new_lines
@@ -231,7 +230,8 @@ function M.accept()
 end
 
 --- Accept the first `n` lines of the current completion, keeping the rest as ghost text.
-local function accept_n_lines(n)
+--- `comp_lines` may be passed by callers that already split the completion.
+local function accept_n_lines(n, comp_lines)
   if not state.is_visible or state.current_index == 0 or #state.completions == 0 then
     return false
   end
@@ -241,7 +241,7 @@ local function accept_n_lines(n)
     return false
   end
 
-  local comp_lines = vim.split(text, '\n', { plain = true })
+  comp_lines = comp_lines or vim.split(text, '\n', { plain = true })
 
   if n >= #comp_lines then
     return M.accept()
@@ -317,7 +317,7 @@ function M.accept_paragraph()
   -- Find first empty line and accept through it (so cursor lands on the next meaningful line)
   for i, line in ipairs(comp_lines) do
     if vim.trim(line) == '' then
-      return accept_n_lines(i)
+      return accept_n_lines(i, comp_lines)
     end
   end
 
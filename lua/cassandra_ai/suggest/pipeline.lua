@@ -104,20 +104,24 @@ local function dispatch_request(req, service, fmt, model_info, additional_contex
   req.start_time = os.clock()
   local prompt_data = fmt(req.before, req.after, { filetype = req.ft, rejected_completions = req.rejected }, additional_context)
 
-  local provider = conf:get('provider')
-  require('cassandra_ai.telemetry'):log_request(req.request_id, {
-    cwd = vim.fn.getcwd(),
-    filename = vim.api.nvim_buf_get_name(0),
-    filetype = req.ft,
-    cursor = { line = state.cursor_pos[1], col = state.cursor_pos[2] },
-    lines_before = req.before,
-    lines_after = req.after,
-    provider = provider.name,
-    provider_config = util.safe_serialize_config(provider.params),
-    model = model_info and model_info.model,
-    prompt_data = prompt_data,
-    additional_context = additional_context,
-  })
+  -- Only build the request record (cwd lookup, config serialization) when telemetry will keep it
+  local telemetry = require('cassandra_ai.telemetry')
+  if telemetry:is_enabled() then
+    local provider = conf:get('provider')
+    telemetry:log_request(req.request_id, {
+      cwd = vim.fn.getcwd(),
+      filename = vim.api.nvim_buf_get_name(0),
+      filetype = req.ft,
+      cursor = { line = state.cursor_pos[1], col = state.cursor_pos[2] },
+      lines_before = req.before,
+      lines_after = req.after,
+      provider = provider.name,
+      provider_config = util.safe_serialize_config(provider.params),
+      model = model_info and model_info.model,
+      prompt_data = prompt_data,
+      additional_context = additional_context,
+    })
+  end
 
   state.current_job = service:complete(prompt_data, function(data)
     handle_completion_response(req, data)
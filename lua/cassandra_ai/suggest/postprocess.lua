@@ -1,36 +1,34 @@
 local M = {}
 
---- Strip lines from the edges of a completion that overlap with surrounding context.
---- Some models echo back parts of the before/after text in their response.
-function M.strip_context_overlap(text, lines_before, lines_after)
-  local lines = vim.split(text, '\n', { plain = true })
-  if #lines == 0 then
-    return text
-  end
-
-  local before_split = vim.split(lines_before, '\n', { plain = true })
-  local after_split = vim.split(lines_after, '\n', { plain = true })
-
-  local before_set = {}
-  for _, line in ipairs(before_split) do
+--- Build a set of the trimmed, non-empty lines of `text`.
+local function line_set(text)
+  local set = {}
+  for line in vim.gsplit(text, '\n', { plain = true }) do
     local trimmed = vim.trim(line)
     if trimmed ~= '' then
-      before_set[trimmed] = true
+      set[trimmed] = true
     end
   end
+  return set
+end
 
-  local after_set = {}
-  for _, line in ipairs(after_split) do
-    local trimmed = vim.trim(line)
-    if trimmed ~= '' then
-      after_set[trimmed] = true
-    end
+--- Strip overlapping edge lines using prebuilt before/after line sets.
+local function strip_overlap(text, before_set, after_set)
+  local lines = vim.split(text, '\n', { plain = true })
+  if #lines == 0 then
+    return text
+  end
+
+  -- Trim each line once; the tail passes below revisit the same lines
+  local trimmed_lines = {}
+  for i = 1, #lines do
+    trimmed_lines[i] = vim.trim(lines[i])
   end
 
   -- Strip leading lines that appear in before context
   local start_strip = 0
   for i = 1, #lines do
-    local trimmed = vim.trim(lines[i])
+    local trimmed = trimmed_lines[i]
     if trimmed ~= '' and before_set[trimmed] then
       start_strip = i
     else
@@ -43,7 +41,7 @@ function M.strip_context_overlap(text, lines_before, lines_after)
   -- to be bridged over, since the after context may have been truncated.
   local tail_skip = 0
   for i = #lines, start_strip + 1, -1 do
-    local trimmed = vim.trim(lines[i])
+    local trimmed = trimmed_lines[i]
     if trimmed == '' or after_set[trimmed] then
       break
     elseif #trimmed <= 2 then
@@ -60,7 +58,7 @@ function M.strip_context_overlap(text, lines_before, lines_after)
 
   local end_strip = 0
   for i = #lines - tail_skip, start_strip + 1, -1 do
-    local trimmed = vim.trim(lines[i])
+    local trimmed = trimmed_lines[i]
     if trimmed == '' or after_set[trimmed] then
       end_strip = end_strip + 1
     else
@@ -77,21 +75,27 @@ function M.strip_context_overlap(text, lines_before, lines_after)
     return text
   end
 
-  local result = {}
-  for i = start_strip + 1, #lines - end_strip do
-    result[#result + 1] = lines[i]
-  end
-
   -- Don't strip everything - return original if nothing would remain
-  if #result == 0 then
+  local last = #lines - end_strip
+  if start_strip + 1 > last then
     return text
   end
 
-  return table.concat(result, '\n')
+  return table.concat(lines, '\n', start_strip + 1, last)
+end
+
+--- Strip lines from the edges of a completion that overlap with surrounding context.
+--- Some models echo back parts of the before/after text in their response.
+function M.strip_context_overlap(text, lines_before, lines_after)
+  return strip_overlap(text, line_set(lines_before), line_set(lines_after))
 end
 
 --- Strip markdown code fences some providers wrap responses in.
 function M.strip_markdown_fences(text)
+  -- Most responses have no fences; skip splitting them into lines
+  if not text:find('```', 1, true) then
+    return text
+  end
   local lines = vim.split(text, '\n', { plain = true })
   if #lines < 2 then
     return text
@@ -109,9 +113,12 @@ function M.strip_markdown_fences(text)
 end
 
 --- Post-process completion candidates: strip fences and context overlap.
+--- The context line sets only depend on the request, so they are built once for all candidates.
 function M.postprocess_completions(data, lines_before, lines_after)
+  local before_set = line_set(lines_before)
+  local after_set = line_set(lines_after)
   for i, item in ipairs(data) do
-    data[i] = M.strip_context_overlap(M.strip_markdown_fences(item), lines_before, lines_after)
+    data[i] = strip_overlap(M.strip_markdown_fences(item), before_set, after_set)
   end
   return data
 end
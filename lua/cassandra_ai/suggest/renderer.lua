@@ -20,17 +20,19 @@ function M.render(text)
 
   require('cassandra_ai.integrations').close_completion_menus()
 
-  local lines = vim.split(text, '\n', { plain = true })
   local row = state.cursor_pos[1] - 1 -- 0-indexed
   local col = state.cursor_pos[2]
 
-  local virt_text = { { lines[1], 'CassandraAiSuggest' } }
+  -- First line renders inline, the rest as virtual lines; stream them without an intermediate list
+  local virt_text = nil
   local virt_lines = nil
 
-  if #lines > 1 then
-    virt_lines = {}
-    for i = 2, #lines do
-      table.insert(virt_lines, { { lines[i], 'CassandraAiSuggest' } })
+  for line in vim.gsplit(text, '\n', { plain = true }) do
+    if not virt_text then
+      virt_text = { { line, 'CassandraAiSuggest' } }
+    else
+      virt_lines = virt_lines or {}
+      table.insert(virt_lines, { { line, 'CassandraAiSuggest' } })
     end
   end
 
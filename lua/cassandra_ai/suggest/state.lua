@@ -12,7 +12,7 @@ local M = {
   pending_rejected = {},
 
   auto_triggered = false,
-  pending_validation = nil, -- { completions, trigger_pos, trigger_bufnr, trigger_line_text }
+  pending_validation = nil, -- { completions, trigger_pos, trigger_bufnr, trigger_line_text, threshold, threshold_overlap }
   validation_idle_timer = nil,
 }
 
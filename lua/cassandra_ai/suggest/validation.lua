@@ -58,6 +58,9 @@ local function parse_overlap(s)
   return words, chars
 end
 
+--- Compiled once; `\k` is resolved against the current buffer's 'iskeyword' at match time.
+local keyword_re = vim.regex('\\k')
+
 --- Classify a character into a word category (matching vim's `w` motion).
 --- Uses iskeyword to distinguish keyword chars from punctuation.
 --- Returns: 1 = keyword, 2 = non-keyword/non-whitespace (punctuation), 3 = whitespace
@@ -65,30 +68,51 @@ local function char_class(ch)
   if ch:match('%s') then
     return 3
   end
-  if vim.fn.match(ch, '\\k') == 0 then
+  if keyword_re:match_str(ch) then
     return 1
   end
   return 2
 end
 
+--- Per-byte class lookup table, rebuilt whenever 'iskeyword' changes.
+local byte_classes = {}
+local byte_classes_iskeyword = nil
+
+--- Return the byte -> class table for the current buffer, filled lazily by `char_class`.
+local function get_byte_classes()
+  local iskeyword = vim.bo.iskeyword
+  if iskeyword ~= byte_classes_iskeyword then
+    byte_classes = {}
+    byte_classes_iskeyword = iskeyword
+  end
+  return byte_classes
+end
+
 --- Walk text and return a list of word spans: { {start, end_}, ... }
 --- A "word" is a maximal run of same-class non-whitespace characters,
 --- matching vim's `w` motion (keyword vs punctuation are separate words).
-local function find_words(text)
+--- Scanning stops once `max_words` spans have been found (if given).
+local function find_words(text, max_words)
+  local classes = get_byte_classes()
+  local function class_at(i)
+    local b = text:byte(i)
+    local cls = classes[b]
+    if not cls then
+      cls = char_class(string.char(b))
+      classes[b] = cls
+    end
+    return cls
+  end
+
   local result = {}
   local len = #text
   local i = 1
-  while i <= len do
-    local ch = text:sub(i, i)
-    local cls = char_class(ch)
+  while i <= len and not (max_words and #result >= max_words) do
+    local cls = class_at(i)
     if cls ~= 3 then
       local start = i
       i = i + 1
-      while i <= len do
-        local c2 = text:sub(i, i)
-        if char_class(c2) ~= cls then
-          break
-        end
+      while i <= len and class_at(i) == cls do
         i = i + 1
       end
       result[#result + 1] = { start, i - 1 }
@@ -111,7 +135,8 @@ local function compute_overlap_threshold(text, overlap_str)
     return chars
   end
 
-  local word_spans = find_words(text)
+  -- Nothing past the word after the N-th one affects the result
+  local word_spans = find_words(text, words_n + 1)
 
   if #word_spans < words_n then
     return nil -- not enough words
@@ -220,8 +245,14 @@ validate_or_defer = function()
   end
 
   -- Check if past the validation threshold
+  -- The threshold only depends on the pending completion and the overlap setting,
+  -- so compute it once per pending completion instead of on every keystroke
   local overlap = conf:get('suggest').auto_trigger_overlap or '1+1'
-  local threshold = compute_overlap_threshold(pv.completions[1], overlap)
+  if pv.threshold_overlap ~= overlap then
+    pv.threshold = compute_overlap_threshold(pv.completions[1], overlap)
+    pv.threshold_overlap = overlap
+  end
+  local threshold = pv.threshold
   if threshold and #typed >= threshold then
     logger.info('deferred: threshold reached (' .. #typed .. '>=' .. threshold .. '), showing completion')
     show_validated_completion(pv, typed)
@@ -134,6 +134,27 @@ function Telemetry:_add_to_buffer(entry)
   end
 end
 
+--- Encode log entries as one JSONL chunk, skipping entries that fail to encode
+--- @param entries table[] Log entries
+--- @return string|nil JSONL content ending in a newline, or nil if nothing encoded
+local function encode_jsonl(entries)
+  local lines = {}
+  for _, entry in ipairs(entries) do
+    local ok, json = pcall(vim.json.encode, entry)
+    if ok then
+      table.insert(lines, json)
+    end
+  end
+
+  if #lines == 0 then
+    return nil
+  end
+
+  -- Trailing empty element yields the final newline without a second copy of the content
+  table.insert(lines, '')
+  return table.concat(lines, '\n')
+end
+
 --- Flush buffer to disk (fire-and-forget async)
 function Telemetry:flush()
   if not config.enabled or #buffer == 0 then
@@ -148,25 +169,15 @@ function Telemetry:flush()
   -- Ensure directory exists
   self:_ensure_directory()
 
-  -- Copy buffer and clear it immediately
-  local entries_to_write = vim.deepcopy(buffer)
+  -- Detach the buffer and start a fresh one; entries are encoded right below, so no copy is needed
+  local entries_to_write = buffer
   buffer = {}
 
-  -- Convert entries to JSONL string
-  local lines = {}
-  for _, entry in ipairs(entries_to_write) do
-    local ok, json = pcall(vim.json.encode, entry)
-    if ok then
-      table.insert(lines, json)
-    end
-  end
-
-  if #lines == 0 then
+  local jsonl_content = encode_jsonl(entries_to_write)
+  if not jsonl_content then
     return
   end
 
-  local jsonl_content = table.concat(lines, '\n') .. '\n'
-
   -- Fire-and-forget write using jobstart
   write_in_progress = true
 
@@ -213,21 +224,11 @@ function Telemetry:shutdown()
   -- Ensure directory exists
   self:_ensure_directory()
 
-  -- Convert buffer to JSONL
-  local lines = {}
-  for _, entry in ipairs(buffer) do
-    local ok, json = pcall(vim.json.encode, entry)
-    if ok then
-      table.insert(lines, json)
-    end
-  end
-
-  if #lines == 0 then
+  local jsonl_content = encode_jsonl(buffer)
+  if not jsonl_content then
     return
   end
 
-  local jsonl_content = table.concat(lines, '\n') .. '\n'
-
   -- Synchronous write for shutdown
   local file = io.open(config.data_file, 'a')
   if file then
@@ -15,4 +15,95 @@ T = new_set({
 
 T['Context Providers - LSP'] = new_set()
 
+T['Context Providers - LSP']['definition cache'] = new_set({
+  hooks = {
+    pre_case = function()
+      -- Stub a client and queue buf_request_sync responses; an empty queue behaves like a timeout (nil)
+      child.lua([[
+        _G._calls = 0
+        _G._responses = {}
+        _G._target = vim.fn.tempname() .. '.lua'
+        vim.fn.writefile({ 'local function target() end' }, _G._target)
+        _G._response = { { result = { uri = vim.uri_from_fname(_G._target), range = { start = { line = 0, character = 0 }, ['end'] = { line = 0, character = 27 } } } } }
+        vim.lsp.get_clients = function()
+          return { { offset_encoding = 'utf-16' } }
+        end
+        vim.lsp.buf_request_sync = function()
+          _G._calls = _G._calls + 1
+          return table.remove(_G._responses, 1)
+        end
+        _G._lsp = require('cassandra_ai.context.lsp')
+      ]])
+    end,
+  },
+})
+
+T['Context Providers - LSP']['definition cache']['retries a timed-out lookup'] = function()
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) == nil'))
+  -- definition, typeDefinition and implementation were all tried
+  h.eq(child.lua_get('_G._calls'), 3)
+
+  child.lua('table.insert(_G._responses, _G._response)')
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) ~= nil'))
+  h.eq(child.lua_get('_G._calls'), 4)
+end
+
+T['Context Providers - LSP']['definition cache']['reuses a resolved definition'] = function()
+  child.lua('table.insert(_G._responses, _G._response)')
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) ~= nil'))
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) ~= nil'))
+  h.eq(child.lua_get('_G._calls'), 1)
+end
+
+T['Context Providers - LSP']['definition cache']['drops a definition when its file changes'] = function()
+  child.lua('table.insert(_G._responses, _G._response)')
+  child.lua('table.insert(_G._responses, _G._response)')
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) ~= nil'))
+
+  child.lua([[vim.fn.writefile({ '-- moved', 'local function target() end' }, _G._target)]])
+  h.is_true(child.lua_get('_G._lsp._get_definition(0, 0, 0, 10) ~= nil'))
+  h.eq(child.lua_get('_G._calls'), 2)
+end
+
+T['Context Providers - LSP']['read_file_entry'] = new_set()
+
+-- Write raw bytes to a temp file in the child and compare the reader's lines with readfile()
+local function lines_match_readfile(content)
+  child.lua(string.format(
+    [[
+      _G._path = vim.fn.tempname()
+      local f = io.open(_G._path, 'wb')
+      f:write(%q)
+      f:close()
+      _G._entry = require('cassandra_ai.context.lsp')._read_file_entry(_G._path)
+    ]],
+    content
+  ))
+  h.eq(child.lua_get('_G._entry.lines'), child.lua_get('vim.fn.readfile(_G._path)'))
+end
+
+T['Context Providers - LSP']['read_file_entry']['drops a UTF-8 BOM'] = function()
+  lines_match_readfile('\239\187\191local a = 1\nlocal b = 2\n')
+end
+
+T['Context Providers - LSP']['read_file_entry']['strips CR before NL'] = function()
+  lines_match_readfile('local a = 1\r\nlocal b = 2\r\n')
+end
+
+T['Context Providers - LSP']['read_file_entry']['keeps an empty last line'] = function()
+  lines_match_readfile('a\n\n')
+end
+
+T['Context Providers - LSP']['read_file_entry']['reads a lone newline as one empty line'] = function()
+  lines_match_readfile('\n')
+end
+
+T['Context Providers - LSP']['read_file_entry']['reads an empty file as no lines'] = function()
+  lines_match_readfile('')
+end
+
+T['Context Providers - LSP']['read_file_entry']['handles a missing trailing newline'] = function()
+  lines_match_readfile('local a = 1\nlocal b = 2')
+end
+
 return T
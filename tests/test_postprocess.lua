@@ -0,0 +1,56 @@
+local h = require('tests.helpers')
+
+local new_set = MiniTest.new_set
+
+local child = MiniTest.new_child_neovim()
+
+T = new_set({
+  hooks = {
+    pre_case = function()
+      h.child_start(child)
+    end,
+    post_case = child.stop,
+  },
+})
+
+T['strip_context_overlap'] = new_set()
+
+-- Helper: call strip_context_overlap in the child process
+local function strip(text, before, after)
+  return child.lua_get(string.format([[require('cassandra_ai.suggest.postprocess').strip_context_overlap(%q, %q, %q)]], text, before, after))
+end
+
+-- Leading lines already present before the cursor are dropped; comparison ignores surrounding whitespace
+T['strip_context_overlap']['strips leading lines echoed from before context'] = function()
+  h.eq(strip('local a = 1\n  local b = 2', 'x\n  local a = 1  ', ''), '  local b = 2')
+end
+
+-- Trailing lines already present after the cursor are dropped
+T['strip_context_overlap']['strips trailing lines echoed from after context'] = function()
+  h.eq(strip('x = 1\nreturn x', '', 'return x\nend'), 'x = 1')
+end
+
+T['strip_context_overlap']['strips both edges'] = function()
+  h.eq(strip('local a = 1\nlocal b = 2\nreturn b', 'local a = 1', 'return b'), 'local b = 2')
+end
+
+-- A short closer (")") after an after-context match is bridged, since the after context may be truncated
+T['strip_context_overlap']['bridges short trailing lines before an after-context match'] = function()
+  h.eq(strip('  foo()\nend\n)', '', 'end'), '  foo()')
+end
+
+-- Short trailing lines alone are not stripped without an actual after-context match
+T['strip_context_overlap']['keeps short trailing lines without an after-context match'] = function()
+  h.eq(strip('  foo()\n)', '', 'end'), '  foo()\n)')
+end
+
+-- At most two short lines are bridged
+T['strip_context_overlap']['does not bridge more than two short lines'] = function()
+  h.eq(strip('  foo()\nend\n)\n)\n)', '', 'end'), '  foo()\nend\n)\n)\n)')
+end
+
+T['strip_context_overlap']['returns the original text when everything would be stripped'] = function()
+  h.eq(strip('local a = 1', 'local a = 1', ''), 'local a = 1')
+end
+
+return T